@@ -12,16 +12,42 @@ import time
 import sys
 import os
 import json
+import math
+import random
 import platform
 import argparse
+import textwrap
+import functools
+import hashlib
+import pickle
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
-# Try import colorama for Windows ANSI support
+# Try import numpy+numba (opsional): numpy untuk layout array lirik dan
+# vektorisasi timing, numba untuk precompute jadwal delay animasi.
 try:
-    import colorama
-    colorama.init()
-except Exception:
-    colorama = None
+    import numpy as _np
+except ImportError:
+    _np = None
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+# Try import orjson (opsional) untuk serialisasi export JSON yang jauh lebih cepat
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Try import colorama for Windows ANSI support (terminal lain sudah ANSI-native)
+colorama = None
+if platform.system() == "Windows":
+    try:
+        import colorama
+        colorama.init()
+    except Exception:
+        colorama = None
 
 # ============================================================================
 # KONSTANTA WARNA TERMINAL
@@ -160,27 +186,29 @@ DEFAULT_CONFIG = {
 # FUNGSI UTILITAS
 # ============================================================================
 
+# Regex di-compile sekali di level modul — dipakai per baris di parse_lrc
+# dan per wrapped line di play_realtime.
+# Menit 1-2 digit, detik 2 digit, fraksi 2-3 digit
+_TIME_RE = re.compile(r'\[(\d{1,2}):(\d{2})\.(\d{2,3})\]')
+_META_RE = re.compile(r'^\[(ti|ar|al|by|offset|re|title|artist|album):', re.IGNORECASE)
+_PAREN_RE = re.compile(r"\([^)]*\)")
+# Waktu tanpa kurung siku untuk input CLI (--offset/--start), fraksi opsional
+_CLOCK_RE = re.compile(r'(\d+):(\d{1,2})(?:\.(\d+))?')
+# Divisor fraksi per jumlah digit (regex LRC menjamin 2 atau 3 digit)
+_FRAC_DIV = {2: 100.0, 3: 1000.0}
+
 def lrc_time_to_seconds(t: str) -> float:
     """
     Mengkonversi format waktu LRC ([MM:SS.mm] atau MM:SS.mm) menjadi detik (float).
     Flexible untuk M atau MM menit, and 2-3 digit fractional seconds.
     """
-    t = t.strip().strip("[]")
-    if ":" in t:
-        parts = t.split(":")
-        minutes = int(parts[0])
-        seconds_part = parts[1]
-        if "." in seconds_part:
-            seconds, frac = seconds_part.split(".")
-            seconds = int(seconds)
-            if len(frac) == 2:
-                return minutes * 60 + seconds + int(frac) / 100.0
-            else:
-                return minutes * 60 + seconds + int(frac) / 1000.0
-        else:
-            return minutes * 60 + int(seconds_part)
-    else:
+    m = _CLOCK_RE.fullmatch(t.strip().strip("[]"))
+    if not m:
         return float(t)
+    minutes, seconds, frac = m.groups()
+    if frac is None:
+        return int(minutes) * 60 + int(seconds)
+    return int(minutes) * 60 + int(seconds) + int(frac) / (100.0 if len(frac) == 2 else 1000.0)
 
 
 def seconds_to_lrc_time(sec: float) -> str:
@@ -213,21 +241,56 @@ def parse_time_input(time_str: str) -> float:
         return float(time_str)
 
 
+# Lazy import PyYAML: hanya dimuat kalau cache sidecar miss, hasilnya di-cache
+# supaya import cost cuma kena sekali per proses.
+_YAML_CACHE = None  # (yaml, Loader, Dumper) atau False jika PyYAML tidak ada
+
+
+def _get_yaml():
+    global _YAML_CACHE
+    if _YAML_CACHE is None:
+        try:
+            import yaml  # pyright: ignore[reportMissingModuleSource]
+            # Pakai loader/dumper C dari libyaml jika tersedia (jauh lebih cepat),
+            # fallback ke implementasi pure-Python.
+            try:
+                from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+            except ImportError:
+                from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+            _YAML_CACHE = (yaml, _Loader, _Dumper)
+        except ImportError:
+            _YAML_CACHE = False
+    return _YAML_CACHE
+
+
 def load_config() -> Dict:
     config_path = "config.yml"
-    try:
-        import yaml  # pyright: ignore[reportMissingModuleSource]
-        yaml_available = True
-    except ImportError:
-        yaml_available = False
+    cache_path = ".config.cache.json"
+
+    # Sidecar cache JSON: kalau mtime config.yml belum berubah, skip parse YAML
+    # sepenuhnya (json.load jauh lebih cepat untuk dict kecil).
+    if os.path.exists(config_path):
+        try:
+            config_mtime = os.path.getmtime(config_path)
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.pop("_mtime", None) == config_mtime:
+                return cached
+        except Exception:
+            pass  # cache tidak ada / korup — parse YAML seperti biasa
+
+    _yaml = _get_yaml()
+    if not _yaml:
         print(f"{YELLOW}[!] PyYAML tidak tersedia. Menggunakan konfigurasi default.{RESET}")
         print(f"{YELLOW}  Install dengan: pip install pyyaml{RESET}\n")
+    else:
+        yaml, _Loader, _Dumper = _yaml
 
     if not os.path.exists(config_path):
-        if yaml_available:
+        if _yaml:
             try:
                 with open(config_path, "w", encoding="utf-8") as f:
-                    yaml.dump(DEFAULT_CONFIG, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+                    yaml.dump(DEFAULT_CONFIG, f, Dumper=_Dumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
                 print(f"{GREEN}[OK] File config.yml dibuat dengan konfigurasi default.{RESET}\n")
             except Exception as e:
                 print(f"{RED}[WARN] Gagal menulis config.yml: {e}{RESET}")
@@ -236,15 +299,21 @@ def load_config() -> Dict:
             print(f"{YELLOW}  Menggunakan konfigurasi default dalam memori.{RESET}\n")
         return DEFAULT_CONFIG
 
-    if yaml_available:
+    if _yaml:
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f) or {}
+                config = yaml.load(f, Loader=_Loader) or {}
             # Merge default + file config
             merged = DEFAULT_CONFIG.copy()
             merged.update({k: v for k, v in config.items() if k != "genres"})
             # merge genres separately
             merged["genres"] = {**DEFAULT_CONFIG["genres"], **config.get("genres", {})}
+            # Tulis cache untuk warm start berikutnya (best-effort)
+            try:
+                with open(cache_path, "w", encoding="utf-8") as f:
+                    json.dump({**merged, "_mtime": os.path.getmtime(config_path)}, f, ensure_ascii=False)
+            except Exception:
+                pass
             return merged
         except Exception as e:
             print(f"{RED}[ERROR] Error membaca config.yml: {e}{RESET}")
@@ -254,14 +323,54 @@ def load_config() -> Dict:
         return DEFAULT_CONFIG
 
 
-def parse_lrc(file: str) -> List[Dict]:
+@dataclass
+class Lyrics:
+    """
+    Lirik dalam layout structure-of-arrays: starts/ends/texts paralel per index.
+    starts dan ends berupa numpy float64 array jika numpy tersedia (operasi
+    timing tervektorisasi), atau list float biasa sebagai fallback.
     """
-    Membaca dan memparse file LRC menjadi list dictionary.
+    starts: List[float]
+    ends: List[float]
+    texts: List[str]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __bool__(self) -> bool:
+        return bool(self.texts)
+
+
+# Cache hasil parse on-disk, key (path absolut, mtime, size) — run ulang file
+# yang sama (dev-loop, retry) langsung pickle.load tanpa scan regex.
+_LRC_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "toktune")
+
+
+def _lrc_cache_path(file: str) -> Optional[str]:
+    try:
+        key = (os.path.abspath(file), os.path.getmtime(file), os.path.getsize(file))
+    except OSError:
+        return None
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+    return os.path.join(_LRC_CACHE_DIR, digest + ".pkl")
+
+
+def parse_lrc(file: str) -> Lyrics:
+    """
+    Membaca dan memparse file LRC menjadi Lyrics (arrays paralel start/end/text).
     Sekarang:
       - Menerima 1-2 digit menit
       - Jika satu baris memiliki beberapa timestamp, buat entry untuk tiap timestamp
       - Mengabaikan metadata [ti:], [ar:], dll.
     """
+    cache_path = _lrc_cache_path(file)
+    if cache_path is not None and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # cache korup — parse ulang seperti biasa
+
     try:
         with open(file, "r", encoding="utf-8") as f:
             raw = f.read()
@@ -275,183 +384,374 @@ def parse_lrc(file: str) -> List[Dict]:
     lines = raw.strip().splitlines()
     lyrics = []
 
-    # Regex lebih fleksibel: menit 1-2 digit, detik 2 digit, fraksi 2-3 digit
-    time_pattern = re.compile(r'\[(\d{1,2}):(\d{2})\.(\d{2,3})\]')
-    meta_pattern = re.compile(r'^\[(ti|ar|al|by|offset|re|title|artist|album):', re.IGNORECASE)
-
     for line in lines:
         line = line.strip()
         if not line:
             continue
         # skip metadata lines
-        if meta_pattern.search(line):
+        if _META_RE.search(line):
             continue
 
-        timestamps = time_pattern.findall(line)
+        timestamps = _TIME_RE.findall(line)
         # remove timestamps from text
-        text = time_pattern.sub('', line).strip()
+        text = _TIME_RE.sub('', line).strip()
         if not timestamps:
             # If no timestamp, try append to previous entry's text if exists
             if lyrics and text:
                 # Append as continuation to last entry
-                lyrics[-1]["text"] += "\n" + text
+                lyrics[-1][1] += "\n" + text
             continue
 
         # If text is empty (some LRC place timestamps only), set to empty string
         for (m, s, ms) in timestamps:
-            minutes = int(m)
-            seconds = int(s)
-            if len(ms) == 2:
-                frac = int(ms) / 100.0
-            else:
-                frac = int(ms) / 1000.0
-            start_time = minutes * 60 + seconds + frac
-            entry = {
-                "start": start_time,
-                "end": start_time + 3.0,  # will be updated later
-                "text": text
-            }
-            lyrics.append(entry)
+            start_time = int(m) * 60 + int(s) + int(ms) / _FRAC_DIV[len(ms)]
+            lyrics.append([start_time, text])
 
     # Sort by start (just in case)
-    lyrics.sort(key=lambda x: x["start"])
+    lyrics.sort(key=lambda x: x[0])
 
-    # Update end times based on next start
-    for i in range(len(lyrics) - 1):
-        lyrics[i]["end"] = lyrics[i + 1]["start"]
+    texts = [entry[1] for entry in lyrics]
+    if _np is not None:
+        starts = _np.fromiter((entry[0] for entry in lyrics), dtype=_np.float64, count=len(lyrics))
+        # End default = start + 3.0; end tiap baris diganti start baris berikutnya
+        ends = starts + 3.0
+        ends[:-1] = starts[1:]
+    else:
+        starts = [entry[0] for entry in lyrics]
+        ends = [s + 3.0 for s in starts]
+        for i in range(len(ends) - 1):
+            ends[i] = starts[i + 1]
 
-    # Last entry: estimate duration if end <= start
-    if lyrics:
-        last = lyrics[-1]
-        if last["end"] <= last["start"]:
-            estimated_duration = max(2.0, len(last["text"]) * 0.1)
-            last["end"] = last["start"] + estimated_duration
+    result = Lyrics(starts=starts, ends=ends, texts=texts)
 
-    return lyrics
+    if cache_path is not None:
+        try:
+            os.makedirs(_LRC_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump(result, f, protocol=5)
+        except Exception:
+            pass  # gagal menulis cache bukan error fatal
 
+    return result
 
-def wrap_text(text: str, width: int) -> List[str]:
-    lines = text.split("\n")
+
+# TextWrapper di-cache per lebar: konstruksi wrapper lumayan mahal dan lebar
+# wrap praktis cuma satu-dua nilai per sesi.
+_WRAPPER_CACHE: Dict[int, textwrap.TextWrapper] = {}
+
+
+# lru_cache: baris chorus yang sama lewat sini berkali-kali per lagu —
+# hasil wrap berupa tuple (immutable) supaya aman di-share antar pemanggil.
+@functools.lru_cache(maxsize=256)
+def wrap_text(text: str, width: int) -> Tuple[str, ...]:
+    wrapper = _WRAPPER_CACHE.get(width)
+    if wrapper is None:
+        wrapper = _WRAPPER_CACHE.setdefault(width, textwrap.TextWrapper(
+            width=width, break_long_words=False, break_on_hyphens=False))
     wrapped = []
-    for line in lines:
+    for line in text.split("\n"):
         if len(line) <= width:
+            # Baris pendek dipertahankan apa adanya (termasuk spasi internal)
             wrapped.append(line)
         else:
-            words = line.split()
-            current_line = ""
-            for word in words:
-                if current_line:
-                    candidate = current_line + " " + word
-                else:
-                    candidate = word
-                if len(candidate) <= width:
-                    current_line = candidate
-                else:
-                    if current_line:
-                        wrapped.append(current_line)
-                    current_line = word
-            if current_line:
-                wrapped.append(current_line)
-    return wrapped
+            wrapped.extend(wrapper.wrap(line) or [""])
+    return tuple(wrapped)
 
 
 # ============================================================================ EFEK ANIMASI (sama, dengan perbaikan cursor erase)
+# Dispatch table per efek: dipakai ganti rantai if/elif string-compare yang
+# jalan sekali per karakter. Lookup dict O(1), dan handler-nya fungsi kecil
+# di level modul sehingga bisa di-bind sekali sebelum loop animasi.
+
+# Tabel sin precomputed (diindeks i & 4095) supaya efek sinusoidal tidak
+# memanggil math.sin per karakter.
+_SIN_MASK = 4095
+
+
+def _sin_table(mult: float, phase: float = 0.0) -> List[float]:
+    return [math.sin(i * mult + phase) for i in range(_SIN_MASK + 1)]
+
+
+_WAVE_SIN = _sin_table(0.5)
+_SWING_SIN = _sin_table(0.3)
+_VIBRATE_SIN = _sin_table(0.7)
+_SALSA_SIN = _sin_table(0.4)
+_REGGAE_SIN = _sin_table(0.35, 0.5)
+
+_GLITCH_CHARS = "!@#$%^&*"
+
+
+def _identity_char(char: str, index: int) -> str:
+    return char
+
+
+def _shake_char(char: str, index: int) -> str:
+    if index % 3 == 0:
+        return char + "\b" + char
+    return char
+
+
+def _glitch_char(char: str, index: int) -> str:
+    if index % 5 == 0:
+        return random.choice(_GLITCH_CHARS) + "\b" + char
+    return char
+
+
+def _vibrate_char(char: str, index: int) -> str:
+    if index % 4 == 0:
+        return char + "\b" + char
+    return char
+
+
+def _const_delay(base_speed: float, char_index: int) -> float:
+    return base_speed
+
+
+def _bounce_delay(base_speed: float, char_index: int) -> float:
+    return base_speed * (0.8 + random.random() * 0.4)
+
+
+def _wave_delay(base_speed: float, char_index: int) -> float:
+    return base_speed * (1.0 + 0.3 * _WAVE_SIN[char_index & _SIN_MASK])
+
+
+def _swing_delay(base_speed: float, char_index: int) -> float:
+    return base_speed * (1.0 + 0.2 * _SWING_SIN[char_index & _SIN_MASK])
+
+
+def _shake_delay(base_speed: float, char_index: int) -> float:
+    if char_index % 3 == 0:
+        return base_speed * 0.5
+    return base_speed
+
+
+def _glitch_delay(base_speed: float, char_index: int) -> float:
+    return base_speed * (0.5 + random.random() * 1.0)
+
+
+def _vibrate_delay(base_speed: float, char_index: int) -> float:
+    return base_speed * (1.0 + 0.15 * _VIBRATE_SIN[char_index & _SIN_MASK])
+
+
+def _salsa_delay(base_speed: float, char_index: int) -> float:
+    return base_speed * (1.0 + 0.25 * _SALSA_SIN[char_index & _SIN_MASK])
+
+
+def _reggae_delay(base_speed: float, char_index: int) -> float:
+    return base_speed * (1.0 + 0.2 * _REGGAE_SIN[char_index & _SIN_MASK])
+
+
+# effect -> (apply_fn, delay_fn); efek tanpa modulasi (smooth, typewriter,
+# glow, dll.) jatuh ke default (_identity_char, _const_delay).
+EFFECTS: Dict[str, Tuple] = {
+    "shake": (_shake_char, _shake_delay),
+    "heavy_shake": (_shake_char, _shake_delay),
+    "glitch": (_glitch_char, _glitch_delay),
+    "bounce": (_identity_char, _bounce_delay),
+    "wave": (_identity_char, _wave_delay),
+    "swing": (_identity_char, _swing_delay),
+    "vibrate": (_vibrate_char, _vibrate_delay),
+    "salsa": (_identity_char, _salsa_delay),
+    "reggae_wave": (_identity_char, _reggae_delay),
+}
+
+_DEFAULT_EFFECT = (_identity_char, _const_delay)
+
+# Kode int per efek deterministik untuk dispatch di dalam fungsi jit
+# (efek ber-random seperti bounce/glitch tetap lewat jalur Python).
+_EFFECT_CODES = {
+    "wave": 0,
+    "swing": 1,
+    "vibrate": 2,
+    "salsa": 3,
+    "reggae_wave": 4,
+    "shake": 5,
+    "heavy_shake": 5,
+}
+
+if _njit is not None and _np is not None:
+    @_njit(cache=True)
+    def _compute_delays_jit(effect_code, base_speed, n):
+        out = _np.empty(n, dtype=_np.float64)
+        for i in range(n):
+            if effect_code == 0:
+                out[i] = base_speed * (1.0 + 0.3 * math.sin(i * 0.5))
+            elif effect_code == 1:
+                out[i] = base_speed * (1.0 + 0.2 * math.sin(i * 0.3))
+            elif effect_code == 2:
+                out[i] = base_speed * (1.0 + 0.15 * math.sin(i * 0.7))
+            elif effect_code == 3:
+                out[i] = base_speed * (1.0 + 0.25 * math.sin(i * 0.4))
+            elif effect_code == 4:
+                out[i] = base_speed * (1.0 + 0.2 * math.sin(i * 0.35 + 0.5))
+            elif effect_code == 5:
+                if i % 3 == 0:
+                    out[i] = base_speed * 0.5
+                else:
+                    out[i] = base_speed
+            else:
+                out[i] = base_speed
+        return out
+else:
+    _compute_delays_jit = None
+
+
+def _compute_delay_schedule(effect: str, base_speed: float, n: int, delay_fn) -> List[float]:
+    """Hitung delay semua karakter satu baris sekaligus (jit kalau bisa)."""
+    if _compute_delays_jit is not None and effect in _EFFECT_CODES:
+        return _compute_delays_jit(_EFFECT_CODES[effect], base_speed, n)
+    return [delay_fn(base_speed, i) for i in range(n)]
+
+
 def apply_effect(char: str, effect: str, index: int) -> str:
-    if effect == "shake" or effect == "heavy_shake":
-        if index % 3 == 0:
-            return char + "\b" + char
-        return char
-    elif effect == "glitch":
-        if index % 5 == 0:
-            import random
-            glitch_chars = "!@#$%^&*"
-            return random.choice(glitch_chars) + "\b" + char
-        return char
-    elif effect == "bounce":
-        return char
-    elif effect == "wave":
-        return char
-    elif effect in ("smooth", "smooth_fade", "elegant_fade"):
-        return char
-    elif effect == "typewriter":
-        return char
-    elif effect == "swing":
-        return char
-    elif effect == "vibrate":
-        if index % 4 == 0:
-            return char + "\b" + char
-        return char
-    elif effect == "glow":
-        return char
-    elif effect in ("salsa", "reggae_wave"):
-        return char
-    elif effect == "cinematic":
-        return char
-    else:
-        return char
+    apply_fn, _ = EFFECTS.get(effect, _DEFAULT_EFFECT)
+    return apply_fn(char, index)
 
 
 def get_animation_delay(effect: str, base_speed: float, char_index: int) -> float:
-    if effect == "bounce":
-        import random
-        return base_speed * (0.8 + random.random() * 0.4)
-    elif effect == "wave":
-        import math
-        return base_speed * (1.0 + 0.3 * math.sin(char_index * 0.5))
-    elif effect == "swing":
-        import math
-        return base_speed * (1.0 + 0.2 * math.sin(char_index * 0.3))
-    elif effect in ("shake", "heavy_shake"):
-        if char_index % 3 == 0:
-            return base_speed * 0.5
-        return base_speed
-    elif effect == "glitch":
-        import random
-        return base_speed * (0.5 + random.random() * 1.0)
-    elif effect == "vibrate":
-        import math
-        return base_speed * (1.0 + 0.15 * math.sin(char_index * 0.7))
-    elif effect == "salsa":
-        import math
-        return base_speed * (1.0 + 0.25 * math.sin(char_index * 0.4))
-    elif effect == "reggae_wave":
-        import math
-        return base_speed * (1.0 + 0.2 * math.sin(char_index * 0.35 + 0.5))
+    _, delay_fn = EFFECTS.get(effect, _DEFAULT_EFFECT)
+    return delay_fn(base_speed, char_index)
+
+
+# fd stdout di-resolve sekali di import; loop animasi menulis langsung lewat
+# os.write supaya lolos dari lock + buffering TextIOWrapper per panggilan.
+# Fallback ke sys.stdout biasa kalau stdout tidak punya fd (mis. dialihkan
+# ke buffer in-memory).
+try:
+    _STDOUT_FD: Optional[int] = sys.stdout.fileno()
+except (AttributeError, OSError, ValueError):
+    _STDOUT_FD = None
+# Jangan pakai fd mentah kalau colorama aktif: wrapper-nya meneruskan
+# fileno() ke console asli, jadi os.write akan melewati penerjemah
+# ANSI->Win32 dan conhost menampilkan escape mentah. Sama halnya kalau
+# encoding stdout bukan UTF-8 — _emit meng-encode UTF-8 secara hardcode,
+# sedangkan TextIOWrapper tahu encoder console yang benar.
+if colorama is not None or (getattr(sys.stdout, "encoding", "") or "").lower().replace("-", "") != "utf8":
+    _STDOUT_FD = None
+
+
+def _emit(s: str) -> None:
+    if _STDOUT_FD is not None:
+        os.write(_STDOUT_FD, s.encode("utf-8"))
     else:
-        return base_speed
+        sys.stdout.write(s)
+        sys.stdout.flush()
 
 
-def animate_text(text: str, color: str, speed: float, effect: str) -> None:
-    print(color, end="", flush=True)
-    cursor_chars = ["|", "/", "-", "\\"]
+def _animate_plain(text: str, colors: List[str], delay: float) -> None:
+    """
+    Jalur cepat untuk efek tanpa modulasi (typewriter, smooth, glow, dll.):
+    karakter tampil apa adanya dengan delay konstan, jadi tidak perlu handler
+    efek, jadwal delay per karakter, maupun cek threshold di dalam loop.
+    """
+    sys.stdout.flush()
+    emit = _emit
+    n = len(text)
+    prev_color = None
+    if delay < 0.02:
+        # Terlalu cepat untuk frame cursor — tulis karakternya saja
+        for i, ch in enumerate(text):
+            color = colors[i]
+            # RESET sebelum warna baru: escape warna saja tidak menghapus DIM
+            emit(ch if color == prev_color else RESET + color + ch)
+            prev_color = color
+            time.sleep(delay)
+        emit(f" \b{RESET}")
+        return
+    cursor_seqs = {}
+    erase_seqs = {}
+    for c in set(colors):
+        cursor_seqs[c] = tuple(f"{BOLD}{c}{ch}{RESET}" for ch in "|/-\\")
+        erase_seqs[c] = f"\b \b{RESET}{c}"
+    cursor_wait = max(delay * 0.4, 0.06)
+    cursor_frame = 0
+    for i, ch in enumerate(text):
+        color = colors[i]
+        # RESET dulu saat ganti warna (lihat animate_line): jaga DIM tidak bocor
+        prefix = "" if color == prev_color else RESET + color
+        prev_color = color
+        if i < n - 1:
+            cursor_frame += 1
+            emit(prefix + ch + cursor_seqs[color][cursor_frame & 3])
+            time.sleep(cursor_wait)
+            emit(erase_seqs[color])
+        else:
+            emit(prefix + ch)
+        time.sleep(delay)
+        if ch == "\n" and i < n - 1:
+            cursor_frame += 1
+            emit(cursor_seqs[color][cursor_frame & 3])
+            time.sleep(cursor_wait)
+            emit(erase_seqs[color])
+    emit(f" \b{RESET}")
+
+
+def animate_line(text: str, colors: List[str], speed: float, effect: str) -> None:
+    """
+    Render satu wrapped line dalam satu pass. colors[i] = warna karakter ke-i
+    (warna utama atau dim untuk bagian kurung/backing vocal); escape warna
+    hanya ditulis saat warnanya berubah dari karakter sebelumnya, jadi satu
+    baris campur warna tetap satu pipeline flush dan satu counter cursor.
+    """
+    # Efek yang tidak ada di tabel EFFECTS berarti identity char + delay
+    # konstan (typewriter, smooth, smooth_fade, elegant_fade, glow,
+    # cinematic) — lewati handler efek sepenuhnya
+    if effect not in EFFECTS:
+        return _animate_plain(text, colors, speed)
+    # Keluarkan dulu output print() yang masih tertahan di buffer supaya
+    # urutannya tidak tertukar dengan tulisan langsung ke fd
+    sys.stdout.flush()
+    emit = _emit
+    # Resolve handler efek sekali sebelum loop, bukan per karakter,
+    # dan hitung jadwal delay seluruh baris di depan
+    apply_fn, delay_fn = EFFECTS.get(effect, _DEFAULT_EFFECT)
+    delays = _compute_delay_schedule(effect, speed, len(text), delay_fn)
+    # Frame cursor + sequence erase per warna distinct (praktis cuma 1-2 warna)
+    cursor_seqs = {}
+    erase_seqs = {}
+    for c in set(colors):
+        # Empat frame cursor siap pakai (panjang 4 → siklus murah lewat & 3)
+        cursor_seqs[c] = tuple(f"{BOLD}{c}{ch}{RESET}" for ch in "|/-\\")
+        # erase cursor reliably (backspace + space + backspace) + restore warna
+        # (lewat RESET dulu supaya atribut DIM tidak terbawa)
+        erase_seqs[c] = f"\b \b{RESET}{c}"
     cursor_frame = 0
+    prev_color = None
+    n = len(text)
     for i, ch in enumerate(text):
-        char_with_effect = apply_effect(ch, effect, i)
-        delay = get_animation_delay(effect, speed, i)
-        print(char_with_effect, end="", flush=True)
-        if i < len(text) - 1:
+        color = colors[i]
+        # Saat ganti warna wajib RESET dulu: escape warna saja tidak menghapus
+        # atribut DIM (SGR 2), jadi transisi dim -> warna utama akan ikut dim
+        prefix = "" if color == prev_color else RESET + color
+        prev_color = color
+        char_with_effect = apply_fn(ch, i)
+        delay = delays[i]
+        # Efek cepat (rap/electronic, delay < 20ms): frame cursor tidak sempat
+        # dirender terminal — tulis karakternya saja, I/O per karakter turun 3x
+        if delay < 0.02:
+            emit(prefix + char_with_effect)
+            time.sleep(delay)
+            continue
+        if i < n - 1:
             cursor_frame += 1
-            cursor_char = cursor_chars[cursor_frame % len(cursor_chars)]
-            # show cursor
-            print(f"{BOLD}{color}{cursor_char}{RESET}", end="", flush=True)
-            # wait a little so cursor visible
+            # show cursor setelah karakter, tunggu sebentar agar terlihat
+            emit(prefix + char_with_effect + cursor_seqs[color][cursor_frame & 3])
             time.sleep(max(delay * 0.4, 0.06))
-            # erase cursor reliably: backspace + space + backspace
-            print("\b \b", end="", flush=True)
-            # restore color
-            print(color, end="", flush=True)
+            emit(erase_seqs[color])
+        else:
+            emit(prefix + char_with_effect)
         time.sleep(delay)
-        if ch == "\n" and i < len(text) - 1:
+        if ch == "\n" and i < n - 1:
             cursor_frame += 1
-            cursor_char = cursor_chars[cursor_frame % len(cursor_chars)]
-            print(f"{BOLD}{color}{cursor_char}{RESET}", end="", flush=True)
+            emit(cursor_seqs[color][cursor_frame & 3])
             time.sleep(max(delay * 0.4, 0.06))
-            print("\b \b", end="", flush=True)
-            print(color, end="", flush=True)
+            emit(erase_seqs[color])
     # ensure no leftover cursor
-    print(" ", end="", flush=True)
-    print("\b", end="", flush=True)
-    print(RESET, end="", flush=True)
+    emit(f" \b{RESET}")
+
+
+def animate_text(text: str, color: str, speed: float, effect: str) -> None:
+    animate_line(text, [color] * len(text), speed, effect)
 
 
 # VT323 banner
@@ -469,60 +769,60 @@ def print_vt323_banner() -> None:
 
 
 # LOADING & COMPLETION (sama behaviour)
-def animate_loading(message: str = "TokTune @username", duration_ms: float = 800) -> None:
+def _animate_progress(prefix: str, duration_ms: float) -> None:
+    """
+    Gambar progress bar hanya di transisi filled-level (21 state untuk
+    bar_width=20), tidur tepat sampai target wall-clock tiap transisi —
+    bukan polling 50ms yang menggambar ulang bar yang identik.
+    """
+    bar_width = 20
+    # Semua frame bar dirakit sekali di depan
+    bars = [
+        f"\r{GRAY}{prefix}[{'#' * k}{'-' * (bar_width - k)}] {int(100 * k / bar_width):3d}%{RESET}"
+        for k in range(bar_width + 1)
+    ]
     duration = duration_ms / 1000.0
     if duration <= 0:
-        bar = "#" * 20
-        print(f"{GRAY}{message} [{bar}] 100%{RESET}\n", flush=True)
+        sys.stdout.write(bars[-1] + "\n\n")
+        sys.stdout.flush()
         return
-    bar_width = 20
-    update_interval = 0.05
-    total_steps = max(1, int(duration / update_interval))
-    for step in range(total_steps + 1):
-        progress = step / total_steps
-        filled = int(progress * bar_width)
-        bar = "#" * filled + "-" * (bar_width - filled)
-        percentage = int(progress * 100)
-        print(f"\r{GRAY}{message} [{bar}] {percentage:3d}%{RESET}", end="", flush=True)
-        time.sleep(update_interval)
-    bar = "#" * bar_width
-    print(f"\r{GRAY}{message} [{bar}] 100%{RESET}\n", flush=True)
+    start = time.monotonic()
+    for k, bar in enumerate(bars):
+        remaining = start + (k / bar_width) * duration - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        sys.stdout.write(bar)
+        sys.stdout.flush()
+    sys.stdout.write("\n\n")
+    sys.stdout.flush()
+
+
+def animate_loading(message: str = "TokTune @username", duration_ms: float = 800) -> None:
+    _animate_progress(f"{message} ", duration_ms)
 
 
 def animate_completion(completion_duration_ms: float = 500) -> None:
     print("\n\n", end="", flush=True)
-    duration = completion_duration_ms / 1000.0
-    if duration <= 0:
-        bar = "#" * 20
-        print(f"{GRAY}[{bar}] 100%{RESET}\n", flush=True)
-        return
-    bar_width = 20
-    update_interval = 0.05
-    total_steps = max(1, int(duration / update_interval))
-    for step in range(total_steps + 1):
-        progress = step / total_steps
-        filled = int(progress * bar_width)
-        bar = "#" * filled + "-" * (bar_width - filled)
-        percentage = int(progress * 100)
-        print(f"\r{GRAY}[{bar}] {percentage:3d}%{RESET}", end="", flush=True)
-        time.sleep(update_interval)
-    bar = "#" * bar_width
-    print(f"\r{GRAY}[{bar}] 100%{RESET}\n", flush=True)
+    _animate_progress("", completion_duration_ms)
 
 
 # MAIN FUNCTIONALITY (schedule, realtime, export)
-def export_json(lyrics: List[Dict], output_file: str, config: Dict) -> None:
+def export_json(lyrics: Lyrics, output_file: str, config: Dict) -> None:
     result = {
         "words": [],
         "captions": []
     }
-    for caption in lyrics:
-        words = caption["text"].split()
-        duration = max(0.0001, caption["end"] - caption["start"])
+    for i in range(len(lyrics)):
+        # float() melepas scalar numpy supaya json.dump tidak tersedak
+        cap_start = float(lyrics.starts[i])
+        cap_end = float(lyrics.ends[i])
+        cap_text = lyrics.texts[i]
+        words = cap_text.split()
+        duration = max(0.0001, cap_end - cap_start)
         step = duration / len(words) if words else duration
         word_timings = []
         for idx, word in enumerate(words):
-            word_start = caption["start"] + idx * step
+            word_start = cap_start + idx * step
             word_end = word_start + step
             wt = {
                 "word": word,
@@ -534,66 +834,89 @@ def export_json(lyrics: List[Dict], output_file: str, config: Dict) -> None:
             word_timings.append(wt)
             result["words"].append(wt)
         result["captions"].append({
-            "start": caption["start"],
-            "end": caption["end"],
-            "start_time": seconds_to_lrc_time(caption["start"]),
-            "end_time": seconds_to_lrc_time(caption["end"]),
-            "text": caption["text"],
+            "start": cap_start,
+            "end": cap_end,
+            "start_time": seconds_to_lrc_time(cap_start),
+            "end_time": seconds_to_lrc_time(cap_end),
+            "text": cap_text,
             "words": word_timings
         })
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # orjson menghasilkan bytes, tulis dalam mode biner
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
     print(f"{GREEN}[OK] JSON exported ke: {output_file}{RESET}")
 
 
+# Di-cache dengan key int (detik dibulatkan ke bawah dulu oleh pemanggil)
+# supaya keyspace terbatas — tampilan MM:SS memang granularitas detik.
+@functools.lru_cache(maxsize=4096)
+def _format_mmss(total_seconds: int) -> str:
+    minutes, secs = divmod(total_seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def _absolute_starts(lyrics: Lyrics, baseline: float, offset: float, speed_multiplier: float) -> List[float]:
+    """
+    Hitung waktu mulai absolut semua baris sekali di depan — satu ekspresi
+    tervektorisasi kalau starts berupa numpy array, list comprehension kalau
+    fallback list.
+    """
+    first_time = lyrics.starts[0]
+    if _np is not None and isinstance(lyrics.starts, _np.ndarray):
+        return baseline + (lyrics.starts - first_time) / speed_multiplier + offset
+    return [baseline + (s - first_time) / speed_multiplier + offset for s in lyrics.starts]
+
+
 def format_time_display(seconds: float, config: Dict) -> str:
     start_minute = config.get("lrc_start_minute", 0)
     start_second = config.get("lrc_start_second", 0)
     start_offset = start_minute * 60 + start_second
-    total_seconds = seconds + start_offset
-    minutes = int(total_seconds // 60)
-    secs = int(total_seconds % 60)
-    return f"{minutes:02d}:{secs:02d}"
+    return _format_mmss(math.floor(seconds + start_offset))
 
 
-def print_schedule(lyrics: List[Dict], genre_config: Dict, config: Dict, offset: float = 0, start_time: Optional[float] = None, speed_multiplier: float = 1.0) -> None:
+def print_schedule(lyrics: Lyrics, genre_config: Dict, config: Dict, offset: float = 0, start_time: Optional[float] = None, speed_multiplier: float = 1.0) -> None:
     if not lyrics:
         print(f"{RED}[ERROR] LRC kosong atau format salah.{RESET}")
         return
-    first_time = lyrics[0]["start"]
     baseline = start_time if start_time is not None else 0.0
-    print(f"\n{YELLOW}=== SCHEDULE LIRIK ==={RESET}\n")
+    abs_starts = _absolute_starts(lyrics, baseline, offset, speed_multiplier)
+    # Mode schedule tidak dianimasikan — rakit seluruh output di memori lalu
+    # tulis sekali (satu syscall, bukan 3-4 print per baris lirik).
+    parts = [f"\n{YELLOW}=== SCHEDULE LIRIK ==={RESET}\n"]
     if speed_multiplier != 1.0:
-        print(f"{YELLOW}Speed multiplier: {speed_multiplier}x{RESET}\n")
-    for line in lyrics:
-        relative_start = (line["start"] - first_time) / speed_multiplier
-        relative_end = (line["end"] - first_time) / speed_multiplier
-        adjusted_start = baseline + relative_start + offset
-        adjusted_end = baseline + relative_end + offset
+        parts.append(f"{YELLOW}Speed multiplier: {speed_multiplier}x{RESET}\n")
+    for i in range(len(lyrics)):
+        adjusted_start = abs_starts[i]
         time_display = format_time_display(adjusted_start, config)
-        print(f"[{seconds_to_lrc_time(adjusted_start)}] ({time_display})")
-        for text_line in line["text"].split("\n"):
-            print(f"  {text_line}")
-        print()
+        parts.append(f"[{seconds_to_lrc_time(adjusted_start)}] ({time_display})")
+        for text_line in lyrics.texts[i].split("\n"):
+            parts.append(f"  {text_line}")
+        parts.append("")
+    sys.stdout.write("\n".join(parts) + "\n")
+    sys.stdout.flush()
 
 
-def play_realtime(lyrics: List[Dict], genre_config: Dict, config: Dict, offset: float = 0, start_time: Optional[float] = None, wrap_width: Optional[int] = None, speed_multiplier: float = 1.0) -> None:
+def play_realtime(lyrics: Lyrics, genre_config: Dict, config: Dict, offset: float = 0, start_time: Optional[float] = None, wrap_width: Optional[int] = None, speed_multiplier: float = 1.0) -> None:
     if not lyrics:
         print(f"{RED}[ERROR] LRC kosong atau format salah.{RESET}")
         return
     color = genre_config["color"]
+    dim_color = f"{DIM}{color}"
     base_speed = genre_config["speed"] / speed_multiplier
     effect = genre_config["effect"]
     margin_between_lines = config["margin_between_lines"]
     block_margin = config["block_margin"]
     wrap_w = wrap_width if wrap_width is not None else config["wrap_width"]
     show_time = config.get("show_time_display", True)
-    first_time = lyrics[0]["start"]
     baseline = start_time if start_time is not None else 0.0
+    abs_starts = _absolute_starts(lyrics, baseline, offset, speed_multiplier)
     playback_start = time.monotonic()
-    for idx, line in enumerate(lyrics):
-        relative_start = (line["start"] - first_time) / speed_multiplier
-        absolute_start = baseline + relative_start + offset
+    for idx in range(len(lyrics)):
+        absolute_start = abs_starts[idx]
         elapsed = time.monotonic() - playback_start
         wait_time = absolute_start - elapsed
         if wait_time > 0:
@@ -601,40 +924,35 @@ def play_realtime(lyrics: List[Dict], genre_config: Dict, config: Dict, offset:
         if show_time:
             time_display = format_time_display(absolute_start, config)
             print(f"{GRAY}[{time_display}]{RESET}", flush=True)
-        text_lines = line["text"].split("\n")
+        text_lines = lyrics.texts[idx].split("\n")
+        # Sample drift sekali per entry lirik — sub-baris hasil wrap dari entry
+        # yang sama toh dimulai hampir bersamaan, jadi tidak perlu
+        # time.monotonic() (syscall clock_gettime) per wrapped line; kecepatan
+        # juga stabil sepanjang entry, tanpa speed-ramp di tengah baris.
+        current_speed = base_speed
+        current_drift = (time.monotonic() - playback_start) - absolute_start
+        if current_drift > 0:
+            catchup = min(3.0, 1.0 + current_drift * 2.0)
+            current_speed = max(base_speed / catchup, 0.001)
         for text_line in text_lines:
             wrapped_lines = wrap_text(text_line, wrap_w)
             for wrapped_line in wrapped_lines:
-                current_speed = base_speed
-                current_drift = (time.monotonic() - playback_start) - absolute_start
-                if current_drift > 0:
-                    catchup = min(3.0, 1.0 + current_drift * 2.0)
-                    current_speed = max(base_speed / catchup, 0.001)
-                trimmed_line = wrapped_line.strip()
-                dim_color = f"{DIM}{color}"
-                if trimmed_line.startswith("-"):
-                    animate_text(wrapped_line, dim_color, current_speed, effect)
+                # Warna per karakter dihitung sekali: baris "-" seluruhnya dim,
+                # selain itu hanya span dalam kurung yang di-dim — lalu satu
+                # panggilan renderer untuk seluruh baris (bukan per segmen).
+                if wrapped_line.strip().startswith("-"):
+                    colors = [dim_color] * len(wrapped_line)
                 else:
-                    last_idx = 0
-                    has_parenthetical = False
-                    for match in re.finditer(r"\([^)]*\)", wrapped_line):
-                        has_parenthetical = True
+                    colors = [color] * len(wrapped_line)
+                    for match in _PAREN_RE.finditer(wrapped_line):
                         start, end = match.span()
-                        if start > last_idx:
-                            animate_text(wrapped_line[last_idx:start], color, current_speed, effect)
-                        animate_text(wrapped_line[start:end], dim_color, current_speed, effect)
-                        last_idx = end
-                    if not has_parenthetical:
-                        animate_text(wrapped_line, color, current_speed, effect)
-                    elif last_idx < len(wrapped_line):
-                        animate_text(wrapped_line[last_idx:], color, current_speed, effect)
+                        colors[start:end] = [dim_color] * (end - start)
+                animate_line(wrapped_line, colors, current_speed, effect)
                 print()
                 time.sleep(margin_between_lines)
         print()
         if idx < len(lyrics) - 1:
-            next_line = lyrics[idx + 1]
-            next_relative_start = (next_line["start"] - first_time) / speed_multiplier
-            next_absolute_start = baseline + next_relative_start + offset
+            next_absolute_start = abs_starts[idx + 1]
             elapsed = time.monotonic() - playback_start
             remaining = next_absolute_start - elapsed
             extra_sleep = min(block_margin, max(0.0, remaining))